@@ -0,0 +1,11 @@
+"""Mini blockchain core package.
+
+Importing the package loads only the core (hashlib and cryptography), so
+validator and miner worker processes start quickly. Plotting lives in
+``mini_blockchain.visualization`` and is imported only when requested.
+"""
+
+from . import core
+from .core import *  # noqa: F401,F403
+
+__all__ = [name for name in core.__all__ if name != "main"]
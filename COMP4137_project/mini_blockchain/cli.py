@@ -0,0 +1,145 @@
+"""Command line interface for the mini blockchain.
+
+Subcommands:
+    mine      mine a chain of blocks from sample transactions
+    validate  mine a chain, then run the integrity checks (and optional attacks)
+    bench     time block mining at a given difficulty
+    prove     build a Merkle tree and generate/verify an inclusion proof
+
+Plotting (``--plot``) imports the optional visualization extra lazily.
+"""
+
+import argparse
+import importlib.util
+import time
+
+from .core import (
+    Blockchain,
+    BlockchainVerifier,
+    MerkleTree,
+    create_sample_transactions,
+)
+
+# Powers of 2 that create_sample_transactions can supply without truncating
+TRANSACTION_COUNTS = [1, 2, 4, 8]
+
+
+def _positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value}")
+    return number
+
+
+def _difficulty(value):
+    number = int(value)
+    if not 1 <= number <= 64:
+        raise argparse.ArgumentTypeError(f"expected a difficulty between 1 and 64, got {value}")
+    return number
+
+
+def _build_chain(num_blocks, num_transactions, difficulty):
+    blockchain = Blockchain()
+    mining_times = []
+    for _ in range(num_blocks):
+        transactions = create_sample_transactions(num_transactions)
+        start_time = time.perf_counter()
+        blockchain.add_block(transactions, difficulty)
+        mining_times.append(time.perf_counter() - start_time)
+    return blockchain, mining_times
+
+
+def _plot_extra_available():
+    return all(importlib.util.find_spec(name) is not None for name in ("matplotlib", "networkx"))
+
+
+def cmd_mine(args):
+    blockchain, mining_times = _build_chain(args.blocks, args.transactions, args.difficulty)
+    print("\n=== Mined Chain ===")
+    for i, block in enumerate(blockchain.chain):
+        print(f"Block {i}: nonce={block.nonce} hash={block.current_hash}")
+    if args.plot:
+        from .visualization import plot_blockchain_structure
+        plot_blockchain_structure(blockchain)
+    return 0
+
+
+def cmd_validate(args):
+    blockchain, _ = _build_chain(args.blocks, args.transactions, args.difficulty)
+    is_valid = blockchain.is_chain_valid()
+    for block in blockchain.chain[1:]:
+        is_valid = BlockchainVerifier.verify_block_integrity(block) and is_valid
+    if args.attack:
+        BlockchainVerifier.simulate_attack(blockchain)
+    print(f"\nChain valid: {is_valid}")
+    return 0 if is_valid else 1
+
+
+def cmd_bench(args):
+    _, mining_times = _build_chain(args.blocks, args.transactions, args.difficulty)
+    print(f"\n=== Mining Benchmark (difficulty {args.difficulty}) ===")
+    for i, mining_time in enumerate(mining_times, start=1):
+        print(f"Block {i}: {mining_time:.4f} seconds")
+    print(f"Average: {sum(mining_times) / len(mining_times):.4f} seconds")
+    if args.plot:
+        from .visualization import plot_mining_stats
+        plot_mining_stats(mining_times)
+    return 0
+
+
+def cmd_prove(args):
+    transactions = create_sample_transactions(args.transactions)
+    merkle_tree = MerkleTree(transactions)
+    proof = merkle_tree.get_proof(args.index)
+    is_included = merkle_tree.verify_transaction(transactions[args.index], proof)
+    print(f"\nTransaction {args.index} included: {is_included}")
+    if args.plot:
+        from .visualization import visualize_merkle_tree
+        visualize_merkle_tree(merkle_tree)
+    return 0 if is_included else 1
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="mini-blockchain", description="Mini blockchain system")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    def add_chain_options(subparser, plot=True):
+        subparser.add_argument("--blocks", type=_positive_int, default=2, help="number of blocks to mine (default: 2)")
+        subparser.add_argument("--transactions", type=int, choices=TRANSACTION_COUNTS, default=4,
+                               help="transactions per block (default: 4)")
+        subparser.add_argument("--difficulty", type=_difficulty, default=4,
+                               help="leading zeros required, 1-64 (default: 4)")
+        if plot:
+            subparser.add_argument("--plot", action="store_true", help="save a plot (requires the plot extra)")
+
+    mine = subparsers.add_parser("mine", help="mine a chain of blocks")
+    add_chain_options(mine)
+    mine.set_defaults(func=cmd_mine)
+
+    validate = subparsers.add_parser("validate", help="mine a chain and verify its integrity")
+    add_chain_options(validate, plot=False)
+    validate.add_argument("--attack", action="store_true", help="also run the attack simulation")
+    validate.set_defaults(func=cmd_validate)
+
+    bench = subparsers.add_parser("bench", help="time block mining")
+    add_chain_options(bench)
+    bench.set_defaults(func=cmd_bench)
+
+    prove = subparsers.add_parser("prove", help="generate and verify a Merkle inclusion proof")
+    prove.add_argument("--transactions", type=int, choices=TRANSACTION_COUNTS, default=4,
+                       help="transactions in the tree (default: 4)")
+    prove.add_argument("--index", type=int, default=0, help="transaction to prove (default: 0)")
+    prove.add_argument("--plot", action="store_true", help="save a plot (requires the plot extra)")
+    prove.set_defaults(func=cmd_prove)
+
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "prove" and not 0 <= args.index < args.transactions:
+        parser.error(f"--index must be between 0 and {args.transactions - 1}, got {args.index}")
+    if getattr(args, "plot", False) and not _plot_extra_available():
+        parser.error('--plot requires matplotlib and networkx; install them with pip install "mini-blockchain[plot]"')
+    return args.func(args)
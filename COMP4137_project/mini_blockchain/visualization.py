@@ -0,0 +1,125 @@
+"""Optional plotting helpers for the mini blockchain.
+
+matplotlib and networkx are imported on first use, so importing this module
+(or the core package) stays cheap. Install them with
+``pip install "mini-blockchain[plot]"``.
+"""
+
+from typing import List
+
+
+def _plotting_backends():
+    """Import matplotlib (headless Agg backend) and networkx on demand"""
+    try:
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+        import networkx as nx
+    except ImportError as e:
+        raise ImportError(
+            "Plotting requires matplotlib and networkx; "
+            'install them with pip install "mini-blockchain[plot]"'
+        ) from e
+    return plt, nx
+
+def visualize_merkle_tree(merkle_tree, filename="merkle_tree.png"):
+    """Generate a visualization of the Merkle tree"""
+    plt, nx = _plotting_backends()
+    G = nx.DiGraph()
+    
+    def add_nodes(node, level=0, pos=0):
+        if node is None:
+            return
+        
+        # Add current node
+        node_hash = node.hash  # MerkleNode has a hash attribute
+        G.add_node(node_hash[:8], hash=node_hash[:8])
+        
+        if node.left:
+            # Add left child
+            left_hash = node.left.hash
+            G.add_node(left_hash[:8], hash=left_hash[:8])
+            G.add_edge(node_hash[:8], left_hash[:8])
+            add_nodes(node.left, level + 1, pos - 1)
+            
+        if node.right:
+            # Add right child
+            right_hash = node.right.hash
+            G.add_node(right_hash[:8], hash=right_hash[:8])
+            G.add_edge(node_hash[:8], right_hash[:8])
+            add_nodes(node.right, level + 1, pos + 1)
+    
+    # Build the graph
+    add_nodes(merkle_tree.root)
+    
+    # Set up the plot
+    plt.figure(figsize=(12, 8))
+    pos = nx.spring_layout(G)
+    
+    # Draw the graph
+    nx.draw(G, pos, with_labels=True, node_color='lightblue', 
+            node_size=2000, font_size=8, font_weight='bold')
+    
+    # Save the plot
+    plt.title("Merkle Tree Structure")
+    plt.savefig(filename)
+    plt.close()
+
+def plot_mining_stats(mining_times: List[float], filename="mining_stats.png"):
+    """Generate a bar plot of mining times"""
+    plt, _ = _plotting_backends()
+    plt.figure(figsize=(10, 6))
+    
+    # Create bar plot
+    bars = plt.bar(range(1, len(mining_times) + 1), mining_times)
+    
+    # Add value labels on top of bars
+    for bar in bars:
+        height = bar.get_height()
+        plt.text(bar.get_x() + bar.get_width()/2., height,
+                f'{height:.2f}s',
+                ha='center', va='bottom')
+    
+    # Customize the plot
+    plt.title('Block Mining Times')
+    plt.xlabel('Block Number')
+    plt.ylabel('Time (seconds)')
+    plt.grid(True, axis='y', linestyle='--', alpha=0.7)
+    
+    # Save the plot
+    plt.savefig(filename)
+    plt.close()
+
+def plot_blockchain_structure(blockchain, filename="blockchain_structure.png"):
+    """Generate a visualization of the blockchain structure"""
+    plt, nx = _plotting_backends()
+    G = nx.DiGraph()
+    
+    # Add blocks as nodes
+    for i, block in enumerate(blockchain.chain):
+        block_hash = block.calculate_hash()
+        # Access nonce directly from block
+        nonce = getattr(block, 'nonce', 'N/A')
+        block_info = f"Block {i}\nHash: {block_hash[:8]}...\nNonce: {nonce}"
+        G.add_node(i, label=block_info)
+        
+        # Add edges between blocks
+        if i > 0:
+            G.add_edge(i-1, i)
+    
+    # Set up the plot
+    plt.figure(figsize=(12, 6))
+    pos = nx.spring_layout(G)
+    
+    # Draw the graph
+    nx.draw(G, pos, node_color='lightgreen',
+            node_size=3000, font_size=8, font_weight='bold')
+    
+    # Add labels
+    labels = nx.get_node_attributes(G, 'label')
+    nx.draw_networkx_labels(G, pos, labels, font_size=8)
+    
+    # Save the plot
+    plt.title("Blockchain Structure")
+    plt.savefig(filename)
+    plt.close()
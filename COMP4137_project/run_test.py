@@ -1,30 +1,17 @@
 import sys
+import os
+import argparse
 import logging
+import subprocess
 from datetime import datetime
-from typing import List
-import matplotlib.pyplot as plt
-import networkx as nx
-import importlib.util
-import os
-import json
-
-
-blockchain_path = os.path.join(os.path.dirname(__file__), "group3_mini_blockchain.py")
-spec = importlib.util.spec_from_file_location("blockchain", blockchain_path)
-blockchain = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(blockchain)
-
 
-Account = blockchain.Account
-Transaction = blockchain.Transaction
-MerkleTree = blockchain.MerkleTree
-Block = blockchain.Block
-Blockchain = blockchain.Blockchain
-create_sample_transactions = blockchain.create_sample_transactions
-BlockchainVerifier = blockchain.BlockchainVerifier
-
-
-from visualization import visualize_merkle_tree, plot_mining_stats, plot_blockchain_structure
+from mini_blockchain import (
+    Account,
+    MerkleTree,
+    Blockchain,
+    BlockchainVerifier,
+    create_sample_transactions,
+)
 
 
 logging.basicConfig(
@@ -36,9 +23,14 @@ logging.basicConfig(
     ]
 )
 
-def run_blockchain_test():
+def run_blockchain_test(plots=True):
     """Run the complete blockchain test pipeline"""
     logging.info("=== Starting Blockchain Test Pipeline ===")
+    if plots:
+        # Imported here so runs without plots never load matplotlib/networkx
+        from mini_blockchain.visualization import (
+            visualize_merkle_tree, plot_mining_stats, plot_blockchain_structure
+        )
     mining_times = []
     
 
@@ -65,7 +57,8 @@ def run_blockchain_test():
     logging.info(f"Merkle Root: {merkle_tree.get_root_hash()}")
     
 
-    visualize_merkle_tree(merkle_tree)
+    if plots:
+        visualize_merkle_tree(merkle_tree)
     
 
     logging.info("\n4. Creating and Mining Blocks")
@@ -88,7 +81,8 @@ def run_blockchain_test():
     logging.info(f"Block 2 mined in {mining_time:.2f} seconds")
     
 
-    plot_mining_stats(mining_times)
+    if plots:
+        plot_mining_stats(mining_times)
     
 
     logging.info("\n5. Verifying Blockchain Integrity")
@@ -96,7 +90,8 @@ def run_blockchain_test():
     logging.info(f"Blockchain is valid: {is_valid}")
     
 
-    plot_blockchain_structure(blockchain)
+    if plots:
+        plot_blockchain_structure(blockchain)
     
 
     logging.info("\n6. Simulating Attacks")
@@ -105,5 +100,31 @@ def run_blockchain_test():
     logging.info("\n=== Test Pipeline Completed ===")
     return blockchain, merkle_tree, mining_times
 
+def check_imports():
+    """Check that importing the core and CLI in a fresh interpreter leaves out the plotting extra"""
+    code = (
+        "import sys, mini_blockchain, mini_blockchain.cli; "
+        "print(' '.join(m for m in ('matplotlib', 'networkx') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True, text=True, check=True
+    )
+    loaded = result.stdout.split()
+    if loaded:
+        logging.error(f"Importing mini_blockchain loaded the plotting extra: {', '.join(loaded)}")
+        return False
+    logging.info("Importing mini_blockchain does not load matplotlib or networkx")
+    return True
+
 if __name__ == "__main__":
-    blockchain, merkle_tree, mining_times = run_blockchain_test() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Run the blockchain test pipeline", allow_abbrev=False)
+    parser.add_argument("--no-plots", action="store_true",
+                        help="skip the visualizations (matplotlib and networkx are not imported)")
+    parser.add_argument("--check-imports", action="store_true",
+                        help="only check that importing mini_blockchain does not load the plotting extra")
+    args = parser.parse_args()
+    if args.check_imports:
+        sys.exit(0 if check_imports() else 1)
+    blockchain, merkle_tree, mining_times = run_blockchain_test(plots=not args.no_plots)